@@ -9,18 +9,31 @@ This script uses a two-step process:
 2. GetLegislation for each bill to get full details (title, sponsor, description)
 """
 
+import io
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
+from functools import lru_cache
 import os
 from pathlib import Path
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+import random
+import threading
 import time
 import sys
+import tempfile
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional accelerator, see dump_json
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -39,80 +52,198 @@ BIENNIUM = "2025-26"
 YEAR = 2026
 DATA_DIR = Path("data")
 DEBUG_DIR = Path("debug")
+SAVE_DEBUG = os.environ.get("WSL_DEBUG") == "1"  # dump raw listing XML to DEBUG_DIR
+UTF8_JSON_FILES = frozenset({"bills.json"})  # other data files stay ASCII-escaped
 
 # XML Namespace
 NS = "http://WSLWebServices.leg.wa.gov/"
 
 # Rate limiting
-REQUEST_DELAY = 0.1  # seconds between API calls
+REQUEST_DELAY = 0.1  # minimum seconds between API call starts
+MAX_ATTEMPTS = 4  # attempts per SOAP call when throttled or timing out
+RETRY_STATUS_CODES = (429, 502, 503, 504)  # throttling and transient gateway errors
+FETCH_WORKERS = 8  # concurrent per-bill and per-agenda requests
 BATCH_SIZE = 50  # Number of bills to fetch details for before saving progress
 
+# Topic keywords - order matters, more specific topics are checked first
+TOPIC_KEYWORDS = {
+    "Technology": ["technology", "internet", "data", "privacy", "cyber", "artificial intelligence", "broadband", "digital"],
+    "Education": ["education", "school", "student", "teacher", "college", "university", "learning", "eceap"],
+    "Tax & Revenue": ["tax", "revenue", "budget", "fiscal", "levy", "assessment"],
+    "Housing": ["housing", "rent", "tenant", "landlord", "zoning", "homeless", "dwelling"],
+    "Healthcare": ["health", "medical", "hospital", "mental", "behavioral", "insurance", "pharmacy", "drug"],
+    "Environment": ["environment", "climate", "energy", "pollution", "water", "salmon", "forest", "wildlife"],
+    "Transportation": ["transport", "road", "highway", "transit", "ferry", "vehicle", "driver", "traffic"],
+    "Public Safety": ["crime", "police", "safety", "justice", "court", "prison", "emergency", "fire"],
+    "Business": ["business", "commerce", "trade", "economy", "license", "employment", "worker", "labor"],
+    "Agriculture": ["farm", "agriculture", "livestock", "crop", "food"],
+    "Social Services": ["child", "family", "welfare", "benefit", "assistance", "disability"],
+}
+
+HIGH_PRIORITY_KEYWORDS = ("emergency", "budget", "funding", "safety", "crisis", "urgent")
+LOW_PRIORITY_KEYWORDS = ("technical", "clarifying", "housekeeping", "minor", "study", "report")
+
+
+def compile_keywords(keywords) -> re.Pattern:
+    """Compile keywords into one substring-matching alternation"""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Compiled once so each classification is a single regex scan per category
+TOPIC_PATTERNS = tuple((topic, compile_keywords(kws)) for topic, kws in TOPIC_KEYWORDS.items())
+HIGH_PRIORITY_PATTERN = compile_keywords(HIGH_PRIORITY_KEYWORDS)
+LOW_PRIORITY_PATTERN = compile_keywords(LOW_PRIORITY_KEYWORDS)
+
+# Bill ID and history patterns used on every bill, compiled once
+BILL_ID_PATTERN = re.compile(r'^(\d*[A-Z]+)(\d+)$')  # "HB1001", "2SHB1037"
+BILL_ID_ALPHA_SUFFIX_PATTERN = re.compile(r'^([A-Z0-9]*[A-Z])(\d+)$')
+TRAILING_NUMBER_PATTERN = re.compile(r'(\d+)$')
+SESSION_LAW_PATTERN = re.compile(r'c \d+ l \d{4}')  # "c 123 l 2025"
+
+# Bill type suffixes by originating chamber (prefixes like 2SHB, ESHB end in these)
+HOUSE_BILL_TYPES = ("HB", "HJR", "HJM", "HCR")
+SENATE_BILL_TYPES = ("SB", "SJR", "SJM", "SCR")
+
+# Shared HTTP session so every SOAP call reuses pooled keep-alive connections
+# instead of paying a new TCP + TLS handshake per request
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+SESSION.headers["Connection"] = "keep-alive"
+# Every call is a SOAP 1.1 POST; only the SOAPAction header varies
+SESSION.headers["Content-Type"] = "text/xml; charset=utf-8"
+
 
 def ensure_dirs():
     """Ensure required directories exist"""
     DATA_DIR.mkdir(exist_ok=True)
-    DEBUG_DIR.mkdir(exist_ok=True)
+    if SAVE_DEBUG:
+        DEBUG_DIR.mkdir(exist_ok=True)
 
 
-def build_soap_envelope(method: str, params: Dict[str, str]) -> str:
-    """Build a SOAP 1.1 envelope for the given method and parameters"""
-    param_xml = "\n".join([f"      <{k}>{v}</{k}>" for k, v in params.items()])
-    
-    envelope = f'''<?xml version="1.0" encoding="utf-8"?>
+SOAP_ENVELOPE_TEMPLATE = '''<?xml version="1.0" encoding="utf-8"?>
 <soap:Envelope xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" 
                xmlns:xsd="http://www.w3.org/2001/XMLSchema" 
                xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">
   <soap:Body>
-    <{method} xmlns="{NS}">
-{param_xml}
+    <{method} xmlns="{ns}">
+{params}
     </{method}>
   </soap:Body>
 </soap:Envelope>'''
-    return envelope
 
 
-def make_soap_request(service_url: str, method: str, params: Dict[str, str], 
-                      save_debug: bool = False, debug_name: str = "") -> Optional[ET.Element]:
-    """Make a SOAP request and return the parsed XML response"""
-    envelope = build_soap_envelope(method, params)
+def build_soap_envelope(method: str, params: Dict[str, str]) -> str:
+    """Build a SOAP 1.1 envelope for the given method and parameters"""
+    param_xml = "\n".join([f"      <{k}>{v}</{k}>" for k, v in params.items()])
+    return SOAP_ENVELOPE_TEMPLATE.format(method=method, ns=NS, params=param_xml)
+
+
+class RateLimiter:
+    """Spaces out request starts across all threads to at most one per interval"""
     
-    headers = {
-        "Content-Type": "text/xml; charset=utf-8",
-        "SOAPAction": f'"{NS}{method}"'
-    }
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
     
-    try:
-        response = requests.post(
-            service_url,
-            data=envelope.encode('utf-8'),
-            headers=headers,
-            timeout=60
-        )
+    def wait(self):
+        """Block until the caller may start its request"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+RATE_LIMITER = RateLimiter(REQUEST_DELAY)
+
+
+def post_soap_request(service_url: str, method: str, params: Dict[str, str],
+                      save_debug: bool = False, debug_name: str = "") -> Optional[bytes]:
+    """
+    Make a SOAP request and return the raw response body, or None on failure.
+    Requests are paced by RATE_LIMITER; throttled or gateway-error responses
+    (RETRY_STATUS_CODES) and timeouts are retried with exponential backoff and
+    jitter.
+    """
+    envelope = build_soap_envelope(method, params)
+    body = envelope.encode('utf-8')
+    headers = {"SOAPAction": f'"{NS}{method}"'}
+    
+    for attempt in range(MAX_ATTEMPTS):
+        if attempt:
+            time.sleep(2 ** attempt + random.random())
+        RATE_LIMITER.wait()
+        
+        try:
+            response = SESSION.post(
+                service_url,
+                data=body,
+                headers=headers,
+                timeout=60
+            )
+        except (requests.Timeout, requests.ConnectionError) as e:
+            logger.warning(f"Request error for {method} (attempt {attempt + 1}/{MAX_ATTEMPTS}): {e}")
+            continue
+        except requests.RequestException as e:
+            logger.error(f"Request error for {method}: {e}")
+            return None
+        
+        if response.status_code in RETRY_STATUS_CODES:
+            logger.warning(f"HTTP {response.status_code} for {method} (attempt {attempt + 1}/{MAX_ATTEMPTS})")
+            continue
         
         if save_debug:
-            debug_file = DEBUG_DIR / f"{debug_name}_request.xml"
-            with open(debug_file, 'w') as f:
-                f.write(envelope)
-            debug_file = DEBUG_DIR / f"{debug_name}_response.xml"
-            with open(debug_file, 'w') as f:
-                f.write(response.text)
+            # Raw bytes as sent and received: no charset detection or re-encoding
+            (DEBUG_DIR / f"{debug_name}_request.xml").write_bytes(body)
+            (DEBUG_DIR / f"{debug_name}_response.xml").write_bytes(response.content)
         
         if response.status_code != 200:
             logger.error(f"HTTP {response.status_code} for {method}")
             return None
         
-        # Parse the response
-        root = ET.fromstring(response.content)
-        return root
-        
-    except requests.RequestException as e:
-        logger.error(f"Request error for {method}: {e}")
+        return response.content
+    
+    logger.error(f"Giving up on {method} after {MAX_ATTEMPTS} attempts")
+    return None
+
+
+def make_soap_request(service_url: str, method: str, params: Dict[str, str], 
+                      save_debug: bool = False, debug_name: str = "") -> Optional[ET.Element]:
+    """Make a SOAP request and return the parsed XML response"""
+    content = post_soap_request(service_url, method, params, save_debug, debug_name)
+    if content is None:
         return None
+    
+    try:
+        return ET.fromstring(content)
     except ET.ParseError as e:
         logger.error(f"XML parse error for {method}: {e}")
         return None
 
 
+def parse_soap_elements(content: bytes, tag_name: str,
+                        parse: Callable[[ET.Element], Optional[Dict]]) -> List[Dict]:
+    """
+    Stream-parse a SOAP response, calling parse on each element with the given tag.
+    Each matched element is cleared once parsed, so the full document tree is never
+    held in memory. Elements for which parse returns None are skipped.
+    Raises ET.ParseError on malformed XML.
+    """
+    tags = (f"{{{NS}}}{tag_name}", tag_name)
+    results = []
+    
+    for _, elem in ET.iterparse(io.BytesIO(content), events=("end",)):
+        if elem.tag in tags:
+            result = parse(elem)
+            if result is not None:
+                results.append(result)
+            elem.clear()
+    
+    return results
+
+
 def strip_namespace(tag: str) -> str:
     """Remove namespace prefix from XML tag"""
     if '}' in tag:
@@ -120,141 +251,152 @@ def strip_namespace(tag: str) -> str:
     return tag
 
 
+@lru_cache(maxsize=None)
+def namespaced_paths(path: str) -> Tuple[str, ...]:
+    """
+    Lookup paths for 'A/B', most specific first (computed once per distinct path):
+    namespaced direct children, namespaced descendants, then un-namespaced
+    direct children (e.g. saved fixtures). ElementTree resolves a plain child
+    path in C, while './/' goes through the Python ElementPath engine, so the
+    common case of a direct child never pays for the descendant search.
+    """
+    qualified = "/".join(f"{{{NS}}}{part}" for part in path.split("/"))
+    return (qualified, ".//" + qualified, path)
+
+
+def find_element(element: ET.Element, path: str) -> Optional[ET.Element]:
+    """Find the first element at path, handling namespaces"""
+    for candidate in namespaced_paths(path):
+        found = element.find(candidate)
+        if found is not None:
+            return found
+    return None
+
+
 def find_element_text(element: ET.Element, path: str, default: str = "") -> str:
     """Find element text, handling namespaces"""
-    # Try with namespace
-    ns_path = path.replace("/", f"/{{{NS}}}").lstrip("/")
-    if not ns_path.startswith("{"):
-        ns_path = f"{{{NS}}}{ns_path}"
-    
-    elem = element.find(f".//{ns_path}")
-    if elem is not None and elem.text:
-        return elem.text.strip()
-    
-    # Try without namespace by iterating
-    parts = path.split("/")
-    current = element
-    for part in parts:
-        found = False
-        for child in current:
-            if strip_namespace(child.tag) == part:
-                current = child
-                found = True
-                break
-        if not found:
-            return default
-    
-    return current.text.strip() if current.text else default
+    # WSL responses are always namespaced with the fields as direct children,
+    # so the first lookup is the hot path
+    for candidate in namespaced_paths(path):
+        text = element.findtext(candidate)
+        if text is not None:
+            return text.strip() or default
+    return default
 
 
 def find_all_elements(root: ET.Element, tag_name: str) -> List[ET.Element]:
     """Find all elements with the given tag name, handling namespaces"""
-    results = []
+    # iter() filters on the exact tag in C, so try the qualified tag and then
+    # the bare one rather than comparing every node's stripped tag in Python
+    return list(root.iter(f"{{{NS}}}{tag_name}")) or list(root.iter(tag_name))
+
+
+def parse_legislation_info(leg_info: ET.Element) -> Optional[Dict]:
+    """Parse a LegislationInfo element into a dict, or None if it has no BillId"""
+    bill_id = find_element_text(leg_info, "BillId")
+    if not bill_id:
+        return None
     
-    # Try with namespace
-    results = root.findall(f".//{{{NS}}}{tag_name}")
+    active_str = find_element_text(leg_info, "Active")
     
-    # If not found, try iterating through all elements
-    if not results:
-        for elem in root.iter():
-            if strip_namespace(elem.tag) == tag_name:
-                results.append(elem)
+    return {
+        "bill_id": bill_id,
+        "bill_number": find_element_text(leg_info, "BillNumber"),
+        "biennium": find_element_text(leg_info, "Biennium") or BIENNIUM,
+        "short_leg_type": find_element_text(leg_info, "ShortLegislationType"),
+        "original_agency": find_element_text(leg_info, "OriginalAgency"),
+        "active": active_str.lower() == "true" if active_str else True,
+        "display_number": find_element_text(leg_info, "DisplayNumber")
+    }
+
+
+def fetch_legislation_info_list(method: str, params: Dict[str, str],
+                                debug_name: str) -> Optional[List[Dict]]:
+    """Fetch and stream-parse a LegislationInfo listing, or None if the request failed"""
+    content = post_soap_request(
+        LEGISLATION_SERVICE,
+        method,
+        params,
+        save_debug=SAVE_DEBUG,
+        debug_name=debug_name
+    )
     
-    return results
+    if content is None:
+        return None
+    
+    try:
+        bills = parse_soap_elements(content, "LegislationInfo", parse_legislation_info)
+    except ET.ParseError as e:
+        logger.error(f"XML parse error for {method}: {e}")
+        return None
+    
+    logger.info(f"Found {len(bills)} LegislationInfo elements from {method}")
+    return bills
 
 
-def get_legislation_list_by_year(year: int) -> List[Dict]:
+def get_legislation_list_by_year(year: int) -> Optional[List[Dict]]:
     """
     Get list of all legislation for a given year.
-    This returns LegislationInfo objects with basic info (BillId, BillNumber, etc.)
+    This returns LegislationInfo objects with basic info (BillId, BillNumber, etc.),
+    or None if the request failed.
     """
     logger.info(f"Fetching legislation list for year {year}...")
     
-    root = make_soap_request(
-        LEGISLATION_SERVICE,
+    return fetch_legislation_info_list(
         "GetLegislationByYear",
         {"year": str(year)},
-        save_debug=True,
-        debug_name="get_legislation_by_year"
+        debug_name=f"get_legislation_by_year_{year}"
     )
-    
-    if root is None:
-        return []
-    
-    bills = []
-    legislation_infos = find_all_elements(root, "LegislationInfo")
-    
-    logger.info(f"Found {len(legislation_infos)} LegislationInfo elements")
-    
-    for leg_info in legislation_infos:
-        bill_id = find_element_text(leg_info, "BillId")
-        bill_number = find_element_text(leg_info, "BillNumber")
-        biennium = find_element_text(leg_info, "Biennium")
-        short_leg_type = find_element_text(leg_info, "ShortLegislationType")
-        original_agency = find_element_text(leg_info, "OriginalAgency")
-        active_str = find_element_text(leg_info, "Active")
-        display_number = find_element_text(leg_info, "DisplayNumber")
-        
-        active = active_str.lower() == "true" if active_str else True
-        
-        if bill_id:
-            bills.append({
-                "bill_id": bill_id,
-                "bill_number": bill_number,
-                "biennium": biennium or BIENNIUM,
-                "short_leg_type": short_leg_type,
-                "original_agency": original_agency,
-                "active": active,
-                "display_number": display_number
-            })
-    
-    return bills
 
 
-def get_prefiled_legislation() -> List[Dict]:
-    """Get prefiled legislation for the biennium"""
+def get_prefiled_legislation() -> Optional[List[Dict]]:
+    """Get prefiled legislation for the biennium, or None if the request failed"""
     logger.info(f"Fetching prefiled legislation for biennium {BIENNIUM}...")
     
-    root = make_soap_request(
-        LEGISLATION_SERVICE,
+    bills = fetch_legislation_info_list(
         "GetPreFiledLegislationInfo",
         {"biennium": BIENNIUM},
-        save_debug=True,
         debug_name="get_prefiled"
     )
     
-    if root is None:
-        return []
-    
-    bills = []
-    legislation_infos = find_all_elements(root, "LegislationInfo")
-    
-    logger.info(f"Found {len(legislation_infos)} prefiled LegislationInfo elements")
-    
-    for leg_info in legislation_infos:
-        bill_id = find_element_text(leg_info, "BillId")
-        bill_number = find_element_text(leg_info, "BillNumber")
-        biennium = find_element_text(leg_info, "Biennium")
-        short_leg_type = find_element_text(leg_info, "ShortLegislationType")
-        original_agency = find_element_text(leg_info, "OriginalAgency")
-        active_str = find_element_text(leg_info, "Active")
-        
-        active = active_str.lower() == "true" if active_str else True
-        
-        if bill_id:
-            bills.append({
-                "bill_id": bill_id,
-                "bill_number": bill_number,
-                "biennium": biennium or BIENNIUM,
-                "short_leg_type": short_leg_type,
-                "original_agency": original_agency,
-                "active": active,
-                "prefiled": True
-            })
+    if bills is None:
+        return None
     
+    for bill in bills:
+        bill["prefiled"] = True
     return bills
 
 
+def get_legislative_status_changes(begin_date: str, end_date: str) -> Optional[set]:
+    """
+    Get the bill numbers whose legislative status changed within a date range.
+    Returns None if the request failed, so callers can tell "no changes" from "unknown".
+    """
+    logger.info(f"Fetching status changes from {begin_date} to {end_date}...")
+
+    root = make_soap_request(
+        LEGISLATION_SERVICE,
+        "GetLegislativeStatusChangesByDateRange",
+        {
+            "biennium": BIENNIUM,
+            "beginDate": f"{begin_date}T00:00:00",
+            "endDate": f"{end_date}T23:59:59"
+        }
+    )
+
+    if root is None:
+        return None
+
+    changed = set()
+    for status in find_all_elements(root, "LegislativeStatus"):
+        _, num = extract_bill_number_from_id(find_element_text(status, "BillId"))
+        if num:
+            changed.add(num)
+
+    logger.info(f"Found status changes for {len(changed)} bill numbers")
+    return changed
+
+
 def get_legislation_details(biennium: str, bill_number: int) -> Optional[Dict]:
     """
     Get full legislation details for a specific bill.
@@ -276,55 +418,41 @@ def get_legislation_details(biennium: str, bill_number: int) -> Optional[Dict]:
         return None
     
     # Get the first (or active) legislation element
-    # The API returns multiple versions if substitutes exist
-    best_leg = None
+    # The API returns multiple versions if substitutes exist. Pick the version
+    # from its BillId alone, then read the remaining fields only for that one.
+    best = None
     for leg in legislation_elements:
-        current_status = leg.find(f".//{{{NS}}}CurrentStatus")
+        current_status = find_element(leg, "CurrentStatus")
         if current_status is None:
-            # Try without namespace
-            for child in leg:
-                if strip_namespace(child.tag) == "CurrentStatus":
-                    current_status = child
-                    break
+            continue
         
-        if current_status is not None:
-            bill_id = find_element_text(current_status, "BillId")
-            status = find_element_text(current_status, "Status")
-            history_line = find_element_text(current_status, "HistoryLine")
-            action_date = find_element_text(current_status, "ActionDate")
-            
-            # Get the details from this legislation element
-            short_desc = find_element_text(leg, "ShortDescription")
-            long_desc = find_element_text(leg, "LongDescription")
-            sponsor = find_element_text(leg, "Sponsor")
-            legal_title = find_element_text(leg, "LegalTitle")
-            introduced_date = find_element_text(leg, "IntroducedDate")
-            prime_sponsor_id = find_element_text(leg, "PrimeSponsorID")
-            requested_by_governor = find_element_text(leg, "RequestedByGovernor")
-            
-            result = {
-                "bill_id": bill_id,
-                "short_description": short_desc,
-                "long_description": long_desc,
-                "sponsor": sponsor,
-                "legal_title": legal_title,
-                "introduced_date": introduced_date,
-                "prime_sponsor_id": prime_sponsor_id,
-                "status": status,
-                "history_line": history_line,
-                "action_date": action_date,
-                "requested_by_governor": requested_by_governor.lower() == "true" if requested_by_governor else False
-            }
-            
-            # Prefer active versions
-            if best_leg is None:
-                best_leg = result
-            elif bill_id and not bill_id.startswith("O"):  # Original/engrossed versions preferred
-                best_leg = result
+        bill_id = find_element_text(current_status, "BillId")
+        # Prefer active versions
+        if best is None or (bill_id and not bill_id.startswith("O")):  # Original/engrossed versions preferred
+            best = (leg, current_status, bill_id)
+    
+    if best is None:
+        return None
     
-    return best_leg
+    leg, current_status, bill_id = best
+    requested_by_governor = find_element_text(leg, "RequestedByGovernor")
+    
+    return {
+        "bill_id": bill_id,
+        "short_description": find_element_text(leg, "ShortDescription"),
+        "long_description": find_element_text(leg, "LongDescription"),
+        "sponsor": find_element_text(leg, "Sponsor"),
+        "legal_title": find_element_text(leg, "LegalTitle"),
+        "introduced_date": find_element_text(leg, "IntroducedDate"),
+        "prime_sponsor_id": find_element_text(leg, "PrimeSponsorID"),
+        "status": find_element_text(current_status, "Status"),
+        "history_line": find_element_text(current_status, "HistoryLine"),
+        "action_date": find_element_text(current_status, "ActionDate"),
+        "requested_by_governor": requested_by_governor.lower() == "true" if requested_by_governor else False
+    }
 
 
+@lru_cache(maxsize=16384)
 def extract_bill_number_from_id(bill_id: str) -> Tuple[str, int]:
     """
     Extract the bill type prefix and numeric bill number from a bill ID.
@@ -346,17 +474,17 @@ def extract_bill_number_from_id(bill_id: str) -> Tuple[str, int]:
     
     # Handle no space - find where letters end and numbers begin
     # Pattern: letters/digits prefix followed by pure digits
-    match = re.match(r'^([A-Z0-9]*[A-Z])(\d+)$', bill_id)
+    match = BILL_ID_ALPHA_SUFFIX_PATTERN.match(bill_id)
     if match:
         return match.group(1), int(match.group(2))
     
     # Handle format like "2SHB1037" - prefix can have leading digit
-    match = re.match(r'^(\d*[A-Z]+)(\d+)$', bill_id)
+    match = BILL_ID_PATTERN.match(bill_id)
     if match:
         return match.group(1), int(match.group(2))
     
     # Last resort - find number at end
-    match = re.search(r'(\d+)$', bill_id)
+    match = TRAILING_NUMBER_PATTERN.search(bill_id)
     if match:
         prefix = bill_id[:match.start()].strip()
         return prefix, int(match.group(1))
@@ -364,6 +492,7 @@ def extract_bill_number_from_id(bill_id: str) -> Tuple[str, int]:
     return bill_id, 0
 
 
+@lru_cache(maxsize=8192)
 def determine_topic(title: str) -> str:
     """Determine bill topic from title keywords"""
     if not title:
@@ -371,28 +500,14 @@ def determine_topic(title: str) -> str:
     
     title_lower = title.lower()
     
-    # Order matters - check more specific topics first
-    topic_keywords = {
-        "Technology": ["technology", "internet", "data", "privacy", "cyber", "artificial intelligence", "broadband", "digital"],
-        "Education": ["education", "school", "student", "teacher", "college", "university", "learning", "eceap"],
-        "Tax & Revenue": ["tax", "revenue", "budget", "fiscal", "levy", "assessment"],
-        "Housing": ["housing", "rent", "tenant", "landlord", "zoning", "homeless", "dwelling"],
-        "Healthcare": ["health", "medical", "hospital", "mental", "behavioral", "insurance", "pharmacy", "drug"],
-        "Environment": ["environment", "climate", "energy", "pollution", "water", "salmon", "forest", "wildlife"],
-        "Transportation": ["transport", "road", "highway", "transit", "ferry", "vehicle", "driver", "traffic"],
-        "Public Safety": ["crime", "police", "safety", "justice", "court", "prison", "emergency", "fire"],
-        "Business": ["business", "commerce", "trade", "economy", "license", "employment", "worker", "labor"],
-        "Agriculture": ["farm", "agriculture", "livestock", "crop", "food"],
-        "Social Services": ["child", "family", "welfare", "benefit", "assistance", "disability"],
-    }
-    
-    for topic, keywords in topic_keywords.items():
-        if any(kw in title_lower for kw in keywords):
+    for topic, pattern in TOPIC_PATTERNS:
+        if pattern.search(title_lower):
             return topic
     
     return "General Government"
 
 
+@lru_cache(maxsize=8192)
 def determine_priority(title: str, requested_by_governor: bool = False) -> str:
     """Determine bill priority based on keywords and source"""
     if requested_by_governor:
@@ -403,17 +518,15 @@ def determine_priority(title: str, requested_by_governor: bool = False) -> str:
     
     title_lower = title.lower()
     
-    high_priority = ["emergency", "budget", "funding", "safety", "crisis", "urgent"]
-    low_priority = ["technical", "clarifying", "housekeeping", "minor", "study", "report"]
-    
-    if any(kw in title_lower for kw in high_priority):
+    if HIGH_PRIORITY_PATTERN.search(title_lower):
         return "high"
-    if any(kw in title_lower for kw in low_priority):
+    if LOW_PRIORITY_PATTERN.search(title_lower):
         return "low"
     
     return "medium"
 
 
+@lru_cache(maxsize=4096)
 def normalize_status(status: str, history_line: str = "", original_agency: str = "") -> str:
     """
     Normalize status to standard values reflecting the full legislative lifecycle.
@@ -443,7 +556,7 @@ def normalize_status(status: str, history_line: str = "", original_agency: str =
         if "governor signed" in history_lower or "signed by governor" in history_lower:
             return "enacted"
         # "C 123 L 2025" pattern = chapter law reference
-        if re.match(r'c \d+ l \d{4}', history_lower):
+        if SESSION_LAW_PATTERN.match(history_lower):
             return "enacted"
         if "delivered to governor" in history_lower or "governor's desk" in history_lower:
             return "governor"
@@ -506,14 +619,9 @@ def format_bill_number(bill_id: str) -> str:
     if ' ' in bill_id:
         return bill_id
     
-    # Handle complex prefixes like 2SHB1037, ESHB1234, 2SSB5001
-    # Pattern: optional leading digits, letters, then the bill number
-    match = re.match(r'^(\d*[A-Z]+)(\d+)$', bill_id)
-    if match:
-        return f"{match.group(1)} {match.group(2)}"
-    
-    # Simple format like HB1001
-    match = re.match(r'^([A-Z]+)(\d+)$', bill_id)
+    # Handles simple IDs like HB1001 and complex prefixes like 2SHB1037,
+    # ESHB1234, 2SSB5001: optional leading digits, letters, then the number
+    match = BILL_ID_PATTERN.match(bill_id)
     if match:
         return f"{match.group(1)} {match.group(2)}"
     
@@ -559,18 +667,11 @@ def get_committee_meetings(begin_date: str, end_date: str) -> List[Dict]:
 
         # Get committee name from nested Committees/Committee/LongName
         committee_name = ""
-        committees_elem = None
-        for child in elem:
-            if strip_namespace(child.tag) == "Committees":
-                committees_elem = child
-                break
-        if committees_elem is not None:
-            for child in committees_elem:
-                if strip_namespace(child.tag) == "Committee":
-                    committee_name = find_element_text(child, "LongName")
-                    if not committee_name:
-                        committee_name = find_element_text(child, "Name")
-                    break
+        committee_elem = find_element(elem, "Committees/Committee")
+        if committee_elem is not None:
+            committee_name = find_element_text(committee_elem, "LongName")
+            if not committee_name:
+                committee_name = find_element_text(committee_elem, "Name")
 
         if agenda_id:
             meetings.append({
@@ -616,6 +717,15 @@ def get_meeting_agenda_items(agenda_id: int) -> List[Dict]:
     return items
 
 
+def fetch_agenda_items(meeting: Dict) -> List[Dict]:
+    """Fetch one meeting's agenda items, or an empty list on failure (non-fatal)"""
+    try:
+        return get_meeting_agenda_items(meeting["agendaId"])
+    except Exception as e:
+        logger.warning(f"Failed to fetch agenda {meeting['agendaId']} (non-fatal): {e}")
+        return []
+
+
 def fetch_hearings_for_bills(bills: List[Dict]) -> None:
     """
     Fetch upcoming committee hearings and attach them to matching bills.
@@ -643,15 +753,11 @@ def fetch_hearings_for_bills(bills: List[Dict]) -> None:
 
     hearings_attached = 0
 
-    for meeting in meetings:
-        time.sleep(REQUEST_DELAY)
-
-        try:
-            items = get_meeting_agenda_items(meeting["agendaId"])
-        except Exception as e:
-            logger.warning(f"Failed to fetch agenda {meeting['agendaId']} (non-fatal): {e}")
-            continue
+    # Agenda requests are independent, so overlap them like the detail fetches
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        agendas = list(executor.map(fetch_agenda_items, meetings))
 
+    for meeting, items in zip(meetings, agendas):
         for item in items:
             bill = bill_lookup.get(item["billId"])
             if bill is not None:
@@ -667,8 +773,128 @@ def fetch_hearings_for_bills(bills: List[Dict]) -> None:
     logger.info(f"Attached {hearings_attached} hearing entries to bills")
 
 
-def fetch_all_bills() -> List[Dict]:
-    """Main function to fetch all bills with full details"""
+def load_existing_bills() -> Dict[int, Dict]:
+    """Load bills saved by the previous run, keyed by bill number (empty if unavailable)"""
+    data_file = DATA_DIR / "bills.json"
+    if not data_file.exists():
+        return {}
+
+    try:
+        data = load_json(data_file)
+    except (json.JSONDecodeError, IOError):
+        return {}
+
+    # Bills from another biennium cannot be reused
+    if data.get("biennium") != BIENNIUM:
+        return {}
+
+    existing = {}
+    for bill in data.get("bills", []):
+        _, num = extract_bill_number_from_id(bill.get("number", ""))
+        if num and bill.get("id"):
+            existing[num] = bill
+    return existing
+
+
+def get_last_successful_sync() -> Optional[str]:
+    """Return the timestamp of the most recent successful (or partial) sync, if any"""
+    log_file = DATA_DIR / "sync-log.json"
+    if not log_file.exists():
+        return None
+
+    try:
+        logs = load_json(log_file).get('logs', [])
+    except (json.JSONDecodeError, IOError):
+        return None
+
+    for log in logs:
+        if log.get("status") in ("success", "partial") and log.get("billsCount"):
+            return log.get("timestamp")
+    return None
+
+
+def get_unchanged_bills(existing_bills: Dict[int, Dict]) -> Dict[int, Dict]:
+    """
+    Find bills from the previous run (keyed by bill number) with no status change
+    since that run, so their details can be reused instead of calling
+    GetLegislation again. Returns an empty dict (full refresh) when there
+    is no usable previous run or the status change feed is unavailable.
+    """
+    last_sync = get_last_successful_sync()
+    if not existing_bills or not last_sync:
+        logger.info("No previous sync to build on - fetching details for all bills")
+        return {}
+
+    try:
+        # Overlap by a day so changes made during the previous run are not missed
+        since = datetime.fromisoformat(last_sync) - timedelta(days=1)
+    except ValueError:
+        return {}
+
+    changed = get_legislative_status_changes(
+        since.strftime("%Y-%m-%d"),
+        datetime.now().strftime("%Y-%m-%d")
+    )
+    if changed is None:
+        logger.warning("Status change feed unavailable - fetching details for all bills")
+        return {}
+
+    unchanged = {num: bill for num, bill in existing_bills.items() if num not in changed}
+
+    logger.info(f"{len(unchanged)} bills unchanged since {last_sync}")
+    return unchanged
+
+
+def merge_legislation_info(all_bill_info: Dict[str, Dict], bills: List[Dict],
+                           prefiled: bool = False) -> None:
+    """
+    Merge LegislationInfo entries into all_bill_info, keyed by bill number.
+    The first source to list a bill wins; later prefiled sources only flag it.
+    Modifies all_bill_info in-place.
+    """
+    for bill in bills:
+        key = bill.get("bill_number") or bill.get("bill_id")
+        if not key:
+            continue
+        
+        # setdefault inserts a bill we have not seen yet in the same call;
+        # only an already-known bill needs reconciling
+        existing = all_bill_info.setdefault(key, bill)
+        if prefiled and existing is not bill:
+            existing["prefiled"] = True
+
+
+def fetch_legislation_listing(name: str, fetch) -> Optional[List[Dict]]:
+    """Run one listing fetch, treating any error as a failed source"""
+    try:
+        bills = fetch()
+    except Exception as e:
+        logger.error(f"{name} failed: {e}")
+        return None
+    
+    if bills is None:
+        logger.error(f"{name} failed")
+    else:
+        logger.info(f"{name} returned {len(bills)} bills")
+    return bills
+
+
+def fetch_bill_details(bill_num: int) -> Optional[Dict]:
+    """Fetch details for one bill number in the current biennium, or None on failure"""
+    try:
+        return get_legislation_details(BIENNIUM, bill_num)
+    except Exception as e:
+        logger.warning(f"Detail fetch for bill number {bill_num} failed: {e}")
+        return None
+
+
+def fetch_all_bills() -> Tuple[List[Dict], List[str], List[str]]:
+    """
+    Main function to fetch all bills with full details.
+    Returns the bills, the IDs of bills that were not in the previous run, and
+    the names of any sources that failed. A failed source does not abort the
+    run; whatever the other sources returned is still processed.
+    """
     logger.info("=" * 60)
     logger.info(f"Starting WA Legislature Bill Fetcher - {datetime.now()}")
     logger.info(f"Biennium: {BIENNIUM}, Year: {YEAR}")
@@ -677,36 +903,34 @@ def fetch_all_bills() -> List[Dict]:
     ensure_dirs()
     
     all_bill_info = {}
+    failed_sources = []
     
     # Step 1: Get list of all bills from GetLegislationByYear
-    year_bills = get_legislation_list_by_year(YEAR)
-    logger.info(f"GetLegislationByYear returned {len(year_bills)} bills")
-    
-    for bill in year_bills:
-        key = bill.get("bill_number") or bill.get("bill_id")
-        if key:
-            all_bill_info[key] = bill
-    
     # Step 2: Get prefiled legislation
-    prefiled_bills = get_prefiled_legislation()
-    logger.info(f"GetPreFiledLegislationInfo returned {len(prefiled_bills)} bills")
-    
-    for bill in prefiled_bills:
-        key = bill.get("bill_number") or bill.get("bill_id")
-        if key:
-            if key not in all_bill_info:
-                all_bill_info[key] = bill
-            else:
-                all_bill_info[key]["prefiled"] = True
-    
     # Also try previous year for carryover bills
-    prev_year_bills = get_legislation_list_by_year(YEAR - 1)
-    logger.info(f"GetLegislationByYear ({YEAR - 1}) returned {len(prev_year_bills)} bills")
-    
-    for bill in prev_year_bills:
-        key = bill.get("bill_number") or bill.get("bill_id")
-        if key and key not in all_bill_info:
-            all_bill_info[key] = bill
+    listings = [
+        (f"GetLegislationByYear ({YEAR})", lambda: get_legislation_list_by_year(YEAR), False),
+        ("GetPreFiledLegislationInfo", get_prefiled_legislation, True),
+        (f"GetLegislationByYear ({YEAR - 1})", lambda: get_legislation_list_by_year(YEAR - 1), False),
+    ]
+    
+    existing_bills = load_existing_bills()
+    
+    # The listings and the status change feed are independent, so fetch them
+    # concurrently; listings are merged afterwards in the order above so the
+    # first source still wins
+    with ThreadPoolExecutor(max_workers=len(listings) + 1) as executor:
+        futures = [executor.submit(fetch_legislation_listing, name, fetch) for name, fetch, _ in listings]
+        # Bills whose status has not changed since the last run keep their details
+        unchanged_future = executor.submit(get_unchanged_bills, existing_bills)
+        results = [future.result() for future in futures]
+        unchanged_bills = unchanged_future.result()
+    
+    for (name, _, prefiled), bills in zip(listings, results):
+        if bills is None:
+            failed_sources.append(name)
+            continue
+        merge_legislation_info(all_bill_info, bills, prefiled=prefiled)
     
     logger.info(f"Total unique bills found: {len(all_bill_info)}")
     
@@ -732,30 +956,58 @@ def fetch_all_bills() -> List[Dict]:
                 if num:
                     bill_numbers_to_fetch.add(num)
     
-    logger.info(f"Fetching details for {len(bill_numbers_to_fetch)} unique bill numbers...")
+    if failed_sources:
+        # Keep covering bills from the previous run that a failed listing would have returned
+        bill_numbers_to_fetch.update(existing_bills)
     
-    for i, bill_num in enumerate(sorted(bill_numbers_to_fetch)):
-        if i > 0 and i % 100 == 0:
-            logger.info(f"Progress: {i}/{len(bill_numbers_to_fetch)} bills processed")
-        
-        # Add rate limiting
-        time.sleep(REQUEST_DELAY)
-        
-        details = get_legislation_details(BIENNIUM, bill_num)
+    logger.info(f"Fetching details for {len(bill_numbers_to_fetch)} unique bill numbers...")
+
+    reused = 0
+
+    # Track bills added since the previous run (by number, so a substitute
+    # replacing its original bill is not counted as new)
+    new_ids = []
+
+    # Detail requests are network-bound, so overlap them across a few workers;
+    # RATE_LIMITER still caps the overall request rate
+    numbers_to_request = [n for n in sorted(bill_numbers_to_fetch) if n not in unchanged_bills]
+    logger.info(f"Requesting details for {len(numbers_to_request)} changed or new bills...")
+    fetched_details = {}
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        results = executor.map(fetch_bill_details, numbers_to_request)
+        for i, (bill_num, details) in enumerate(zip(numbers_to_request, results), 1):
+            fetched_details[bill_num] = details
+            if i % 100 == 0:
+                logger.info(f"Progress: {i}/{len(numbers_to_request)} bill details fetched")
+
+    # One timestamp for every bill refreshed in this run
+    fetched_at = datetime.now().isoformat()
+
+    for bill_num in sorted(bill_numbers_to_fetch):
+        previous = unchanged_bills.get(bill_num)
+        if previous is not None:
+            # Hearings are re-attached from scratch in step 4
+            final_bills.append({**previous, "hearings": []})
+            reused += 1
+            continue
+
+        details = fetched_details[bill_num]
         
         if details and details.get("bill_id"):
             bill_id = details["bill_id"]
             prefix, num = extract_bill_number_from_id(bill_id)
 
             # Determine chamber/agency from bill prefix (needed for status detection)
-            if prefix.endswith("HB") or prefix.endswith("HJR") or prefix.endswith("HJM") or prefix.endswith("HCR"):
+            if prefix.endswith(HOUSE_BILL_TYPES):
                 original_agency = "House"
-            elif prefix.endswith("SB") or prefix.endswith("SJR") or prefix.endswith("SJM") or prefix.endswith("SCR"):
+            elif prefix.endswith(SENATE_BILL_TYPES):
                 original_agency = "Senate"
             else:
                 original_agency = prefix
 
-            title = details.get("short_description") or details.get("long_description") or "No title available"
+            long_description = details.get("long_description")
+            introduced_date = details.get("introduced_date")
+            title = details.get("short_description") or long_description or "No title available"
             sponsor = details.get("sponsor") or "Unknown"
             status = normalize_status(
                 details.get("status", ""),
@@ -768,13 +1020,13 @@ def fetch_all_bills() -> List[Dict]:
                 "number": format_bill_number(bill_id),
                 "title": title,
                 "sponsor": sponsor,
-                "description": details.get("long_description") or f"A bill relating to {title.lower()}",
+                "description": long_description or f"A bill relating to {title.lower()}",
                 "status": status,
                 "committee": "",  # Would need additional API call to get current committee
                 "priority": determine_priority(title, details.get("requested_by_governor", False)),
                 "topic": determine_topic(title),
-                "introducedDate": details.get("introduced_date", "")[:10] if details.get("introduced_date") else "",
-                "lastUpdated": datetime.now().isoformat(),
+                "introducedDate": introduced_date[:10] if introduced_date else "",
+                "lastUpdated": fetched_at,
                 "legUrl": get_leg_url(num, prefix),
                 "hearings": [],
                 "active": True,
@@ -785,11 +1037,16 @@ def fetch_all_bills() -> List[Dict]:
             
             final_bills.append(bill)
             processed += 1
+            if existing_bills and num not in existing_bills:
+                new_ids.append(bill["id"])
         else:
             failed += 1
             logger.debug(f"No details found for bill number {bill_num}")
     
-    logger.info(f"Successfully processed {processed} bills, {failed} failed")
+    logger.info(f"Successfully processed {processed} bills, {failed} failed, {reused} reused unchanged")
+    logger.info(f"{len(new_ids)} new bills since the previous run")
+    if failed_sources:
+        logger.warning(f"Failed sources: {', '.join(failed_sources)}")
 
     # Step 4: Fetch upcoming hearings and attach to bills
     # This is additive only — if it fails, bills are still returned without hearings
@@ -798,23 +1055,26 @@ def fetch_all_bills() -> List[Dict]:
     except Exception as e:
         logger.warning(f"Hearing fetch failed (non-fatal, bills unaffected): {e}")
 
-    return final_bills
+    return final_bills, new_ids, failed_sources
 
 
-def save_bills_data(bills: List[Dict]) -> Dict:
-    """Save bills data to JSON file"""
-    # Sort bills by type then number
-    def sort_key(b):
-        prefix, num = extract_bill_number_from_id(b.get("number", ""))
-        # Sort order: HB, SB, HJR, SJR, HJM, SJM, HCR, SCR, other
-        type_order = {"HB": 1, "SB": 2, "HJR": 3, "SJR": 4, "HJM": 5, "SJM": 6, "HCR": 7, "SCR": 8}
-        # Handle prefixes like 2SHB, ESHB, etc.
-        base_type = prefix[-2:] if len(prefix) >= 2 else prefix
-        return (type_order.get(base_type, 99), num)
-    
-    bills.sort(key=sort_key)
-    
-    data = {
+# Sort order: HB, SB, HJR, SJR, HJM, SJM, HCR, SCR, other
+BILL_TYPE_ORDER = {"HB": 1, "SB": 2, "HJR": 3, "SJR": 4, "HJM": 5, "SJM": 6, "HCR": 7, "SCR": 8}
+
+
+def bill_sort_key(bill: Dict) -> Tuple[int, int]:
+    """Sort key placing bills by type, then number"""
+    prefix, num = extract_bill_number_from_id(bill.get("number", ""))
+    # Handle prefixes like 2SHB, ESHB, etc.
+    base_type = prefix[-2:] if len(prefix) >= 2 else prefix
+    return (BILL_TYPE_ORDER.get(base_type, 99), num)
+
+
+def build_bills_data(bills: List[Dict]) -> Dict:
+    """Build the bills.json payload, sorting bills by type then number"""
+    bills.sort(key=bill_sort_key)
+    
+    return {
         "lastSync": datetime.now().isoformat(),
         "sessionYear": YEAR,
         "sessionStart": "2026-01-12",
@@ -829,92 +1089,65 @@ def save_bills_data(bills: List[Dict]) -> Dict:
             "dataVersion": "3.0.0"
         }
     }
-    
-    data_file = DATA_DIR / "bills.json"
-    with open(data_file, 'w') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    
-    logger.info(f"Saved {len(bills)} bills to {data_file}")
-    return data
 
 
-def create_stats_file(bills: List[Dict]):
-    """Create comprehensive statistics file"""
-    stats = {
-        "generated": datetime.now().isoformat(),
-        "totalBills": len(bills),
-        "byStatus": {},
-        "byCommittee": {},
-        "byPriority": {},
-        "byTopic": {},
-        "bySponsor": {},
-        "byType": {},
-        "byAgency": {},
-        "recentlyUpdated": 0,
-        "updatedToday": 0
-    }
-    
-    today = datetime.now().date()
-    
+def build_stats(bills: List[Dict], new_ids: Optional[List[str]] = None) -> Dict:
+    """Build the comprehensive statistics payload for stats.json"""
+    # Counter(iterable) counts in C, one pass per field
+    by_status = Counter(bill.get('status', 'unknown') for bill in bills)
+    by_committee = Counter(bill.get('committee') or 'Unassigned' for bill in bills)
+    by_priority = Counter(bill.get('priority', 'unknown') for bill in bills)
+    by_topic = Counter(bill.get('topic', 'unknown') for bill in bills)
+    by_sponsor = Counter(bill.get('sponsor', 'unknown') for bill in bills)
+    by_agency = Counter(bill.get('originalAgency', 'Unknown') for bill in bills)
+    by_type = Counter()
     for bill in bills:
-        # By status
-        status = bill.get('status', 'unknown')
-        stats['byStatus'][status] = stats['byStatus'].get(status, 0) + 1
-        
-        # By committee
-        committee = bill.get('committee') or 'Unassigned'
-        stats['byCommittee'][committee] = stats['byCommittee'].get(committee, 0) + 1
-        
-        # By priority
-        priority = bill.get('priority', 'unknown')
-        stats['byPriority'][priority] = stats['byPriority'].get(priority, 0) + 1
-        
-        # By topic
-        topic = bill.get('topic', 'unknown')
-        stats['byTopic'][topic] = stats['byTopic'].get(topic, 0) + 1
-        
-        # By sponsor
-        sponsor = bill.get('sponsor', 'unknown')
-        stats['bySponsor'][sponsor] = stats['bySponsor'].get(sponsor, 0) + 1
-        
-        # By type
         prefix, _ = extract_bill_number_from_id(bill.get('number', ''))
-        base_type = prefix[-2:] if len(prefix) >= 2 else prefix
-        stats['byType'][base_type] = stats['byType'].get(base_type, 0) + 1
-        
-        # By original agency (chamber)
-        agency = bill.get('originalAgency', 'Unknown')
-        stats['byAgency'][agency] = stats['byAgency'].get(agency, 0) + 1
-        
-        # Recently updated
-        try:
-            last_updated = datetime.fromisoformat(bill.get('lastUpdated', '').replace('Z', '+00:00'))
-            if last_updated.date() == today:
-                stats['updatedToday'] += 1
-            if (datetime.now() - last_updated.replace(tzinfo=None)).days < 7:
-                stats['recentlyUpdated'] += 1
-        except (ValueError, TypeError):
-            pass
+        by_type[prefix[-2:] if len(prefix) >= 2 else prefix] += 1
     
-    # Top sponsors
-    stats['topSponsors'] = sorted(
-        stats['bySponsor'].items(),
-        key=lambda x: x[1],
-        reverse=True
-    )[:20]
+    # Take the clock once; every bill is compared against the same instant
+    now = datetime.now()
+    today = now.date()
     
-    stats_file = DATA_DIR / "stats.json"
-    with open(stats_file, 'w') as f:
-        json.dump(stats, f, indent=2)
+    # Bills refreshed in the same run share a lastUpdated value, so each
+    # distinct timestamp is only parsed and classified once
+    recency = {}
+    for value, count in Counter(bill.get('lastUpdated', '') for bill in bills).items():
+        try:
+            last_updated = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except (ValueError, TypeError, AttributeError):
+            continue
+        recency[value] = (count, last_updated.date() == today,
+                          (now - last_updated.replace(tzinfo=None)).days < 7)
+    updated_today = sum(count for count, is_today, _ in recency.values() if is_today)
+    recently_updated = sum(count for count, _, is_recent in recency.values() if is_recent)
+    
+    stats = {
+        "generated": now.isoformat(),
+        "totalBills": len(bills),
+        "newBills": len(new_ids or []),
+        "latestAdditions": new_ids or [],
+        "byStatus": dict(by_status),
+        "byCommittee": dict(by_committee),
+        "byPriority": dict(by_priority),
+        "byTopic": dict(by_topic),
+        "bySponsor": dict(by_sponsor),
+        "byType": dict(by_type),
+        "byAgency": dict(by_agency),
+        "recentlyUpdated": recently_updated,
+        "updatedToday": updated_today,
+        # Top sponsors
+        "topSponsors": by_sponsor.most_common(20)
+    }
     
-    logger.info(f"Statistics saved to {stats_file}")
-    logger.info(f"  - {len(stats['byStatus'])} statuses")
-    logger.info(f"  - {len(stats['byTopic'])} topics")
-    logger.info(f"  - {len(stats['bySponsor'])} unique sponsors")
+    logger.info(f"Statistics: {len(by_status)} statuses, "
+                f"{len(by_topic)} topics, {len(by_sponsor)} unique sponsors")
+    return stats
 
 
-def create_sync_log(bills_count: int, status: str = "success"):
-    """Create sync log entry"""
+def build_sync_log(bills_count: int, status: str = "success",
+                   failed_sources: Optional[List[str]] = None) -> Dict:
+    """Build the sync-log.json payload with a new entry prepended"""
     log = {
         "timestamp": datetime.now().isoformat(),
         "status": status,
@@ -922,50 +1155,145 @@ def create_sync_log(bills_count: int, status: str = "success"):
         "biennium": BIENNIUM,
         "year": YEAR
     }
+    if failed_sources:
+        log["failedSources"] = failed_sources
     
     log_file = DATA_DIR / "sync-log.json"
     
     logs = []
     if log_file.exists():
         try:
-            with open(log_file, 'r') as f:
-                data = json.load(f)
-                logs = data.get('logs', [])
+            logs = load_json(log_file).get('logs', [])
         except (json.JSONDecodeError, IOError):
             pass
     
     logs.insert(0, log)
     logs = logs[:100]  # Keep last 100 entries
     
-    with open(log_file, 'w') as f:
-        json.dump({"logs": logs}, f, indent=2)
+    logger.info(f"Sync log entry: {status} - {bills_count} bills")
+    return {"logs": logs}
+
+
+def load_json(path: Path) -> Dict:
+    """
+    Read a JSON file written by write_data_files.
+    Parses the raw bytes with orjson when installed. Its decode error
+    subclasses json.JSONDecodeError, so callers handle both the same way.
+    """
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dump_json(payload: Dict, ensure_ascii: bool = False) -> bytes:
+    """
+    Serialize a payload as 2-space indented UTF-8 JSON.
+    Uses orjson when installed; the stdlib encoder falls back to pure Python
+    whenever indent is set, which is slow for a multi-MB bills.json.
+    Both produce the same output. orjson cannot escape non-ASCII characters,
+    so ensure_ascii output always comes from the stdlib encoder.
+    """
+    if orjson is not None and not ensure_ascii:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, ensure_ascii=ensure_ascii).encode('utf-8')
+
+
+def write_json(f, payload: Dict, ensure_ascii: bool = False) -> None:
+    """
+    Write a payload to a binary file in the dump_json format.
+    Without orjson the stdlib encoder streams chunks straight to the file
+    instead of materializing the whole document as a str and then as bytes.
+    """
+    if orjson is not None and not ensure_ascii:
+        f.write(dump_json(payload))
+        return
+    text = io.TextIOWrapper(f, encoding='utf-8')
+    json.dump(payload, text, indent=2, ensure_ascii=ensure_ascii)
+    text.flush()
+    text.detach()
+
+
+def write_data_files(files: Dict[str, Dict]) -> None:
+    """
+    Write JSON payloads into DATA_DIR, keyed by file name.
+    All files are staged in a temporary directory next to their targets, synced,
+    and then renamed into place, so readers never see a partially written file,
+    even after a crash. The data directory is synced once for the whole batch
+    rather than once per file. Only UTF8_JSON_FILES are written as raw UTF-8;
+    the rest keep json.dump's default ASCII escaping.
+    """
+    DATA_DIR.mkdir(exist_ok=True)
     
-    logger.info(f"Sync log updated: {status} - {bills_count} bills")
+    with tempfile.TemporaryDirectory(dir=DATA_DIR) as staging_dir:
+        staged = []
+        for name, payload in files.items():
+            staged_file = Path(staging_dir) / name
+            with open(staged_file, 'wb', buffering=1 << 20) as f:
+                write_json(f, payload, ensure_ascii=name not in UTF8_JSON_FILES)
+                # Contents must be on disk before the rename can expose them
+                f.flush()
+                os.fsync(f.fileno())
+            staged.append((staged_file, DATA_DIR / name))
+        
+        for staged_file, data_file in staged:
+            os.replace(staged_file, data_file)
+            logger.info(f"Saved {data_file}")
+    
+    # Persist the renames with a single directory sync (POSIX only)
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(DATA_DIR, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def save_bills_data(bills: List[Dict]) -> Dict:
+    """Save bills data to JSON file"""
+    data = build_bills_data(bills)
+    write_data_files({"bills.json": data})
+    return data
+
+
+def create_stats_file(bills: List[Dict], new_ids: Optional[List[str]] = None):
+    """Create comprehensive statistics file"""
+    write_data_files({"stats.json": build_stats(bills, new_ids)})
+
+
+def create_sync_log(bills_count: int, status: str = "success",
+                    failed_sources: Optional[List[str]] = None):
+    """Create sync log entry"""
+    write_data_files({"sync-log.json": build_sync_log(bills_count, status, failed_sources)})
 
 
 def main():
     """Main execution function"""
     try:
         # Fetch all bills with full details
-        bills = fetch_all_bills()
+        bills, new_ids, failed_sources = fetch_all_bills()
         
         if not bills:
             logger.error("No bills fetched - check API connectivity")
-            create_sync_log(0, "error")
+            create_sync_log(0, "error", failed_sources)
             sys.exit(1)
         
-        # Save data
-        save_bills_data(bills)
-        
-        # Create statistics
-        create_stats_file(bills)
+        # Save whatever was fetched, even if some sources failed
+        status = "partial" if failed_sources else "success"
         
-        # Create sync log
-        create_sync_log(len(bills), "success")
+        # Save data, statistics and sync log together
+        write_data_files({
+            "bills.json": build_bills_data(bills),
+            "stats.json": build_stats(bills, new_ids),
+            "sync-log.json": build_sync_log(len(bills), status, failed_sources)
+        })
         
         logger.info("=" * 60)
-        logger.info(f"Completed successfully!")
-        logger.info(f"Total bills: {len(bills)}")
+        if failed_sources:
+            logger.info(f"Completed with partial data (failed: {', '.join(failed_sources)})")
+        else:
+            logger.info(f"Completed successfully!")
+        logger.info(f"Total bills: {len(bills)} ({len(new_ids)} new)")
         logger.info("=" * 60)
         
     except Exception as e:
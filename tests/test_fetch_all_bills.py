@@ -11,9 +11,12 @@ from datetime import datetime
 from pathlib import Path
 import sys
 import os
+import tempfile
+from unittest import mock
 
 # Add the scripts directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scripts import fetch_all_bills
 from scripts.fetch_all_bills import (
     build_soap_envelope,
     strip_namespace,
@@ -25,6 +28,15 @@ from scripts.fetch_all_bills import (
     normalize_status,
     format_bill_number,
     get_leg_url,
+    get_unchanged_bills,
+    parse_soap_elements,
+    parse_legislation_info,
+    merge_legislation_info,
+    fetch_legislation_listing,
+    write_data_files,
+    dump_json,
+    load_json,
+    post_soap_request,
     NS
 )
 
@@ -393,6 +405,42 @@ class TestSOAPResponseParsing(unittest.TestCase):
         bill_ids = [find_element_text(info, "BillId") for info in infos]
         self.assertIn("HB 1001", bill_ids)
         self.assertIn("HB 1002", bill_ids)
+    
+    def test_stream_parse_legislation_info_list(self):
+        """Test stream-parsing a listing into LegislationInfo dicts"""
+        xml = f'''<?xml version="1.0" encoding="utf-8"?>
+        <soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">
+            <soap:Body>
+                <GetLegislationByYearResponse xmlns="{NS}">
+                    <GetLegislationByYearResult>
+                        <LegislationInfo>
+                            <BillId>HB 1001</BillId>
+                            <BillNumber>1001</BillNumber>
+                            <Active>false</Active>
+                        </LegislationInfo>
+                        <LegislationInfo>
+                            <BillNumber>1002</BillNumber>
+                        </LegislationInfo>
+                    </GetLegislationByYearResult>
+                </GetLegislationByYearResponse>
+            </soap:Body>
+        </soap:Envelope>'''.encode("utf-8")
+        
+        bills = parse_soap_elements(xml, "LegislationInfo", parse_legislation_info)
+        
+        # The entry without a BillId is skipped
+        self.assertEqual(len(bills), 1)
+        self.assertEqual(bills[0]["bill_id"], "HB 1001")
+        self.assertEqual(bills[0]["bill_number"], "1001")
+        self.assertEqual(bills[0]["biennium"], "2025-26")
+        self.assertFalse(bills[0]["active"])
+    
+    def test_stream_parse_without_namespace(self):
+        """Test stream-parsing matches elements that carry no namespace"""
+        xml = b"<root><LegislationInfo><BillId>SB 5001</BillId></LegislationInfo></root>"
+        
+        bills = parse_soap_elements(xml, "LegislationInfo", parse_legislation_info)
+        self.assertEqual([b["bill_id"] for b in bills], ["SB 5001"])
 
 
 class TestDataOutputFormat(unittest.TestCase):
@@ -455,5 +503,167 @@ class TestDataOutputFormat(unittest.TestCase):
             self.assertIn(result, valid_priorities)
 
 
+class TestMergeLegislationInfo(unittest.TestCase):
+    """Test merging bill lists from the different listing endpoints"""
+    
+    def test_first_source_wins(self):
+        """Test bills already present are not replaced by later sources"""
+        all_bill_info = {}
+        merge_legislation_info(all_bill_info, [{"bill_id": "HB 1001", "bill_number": "1001"}])
+        merge_legislation_info(all_bill_info, [
+            {"bill_id": "SHB 1001", "bill_number": "1001"},
+            {"bill_id": "HB 1002", "bill_number": "1002"}
+        ])
+        
+        self.assertEqual(all_bill_info["1001"]["bill_id"], "HB 1001")
+        self.assertIn("1002", all_bill_info)
+    
+    def test_prefiled_source_flags_existing(self):
+        """Test a prefiled listing flags bills that are already known"""
+        all_bill_info = {"1001": {"bill_id": "HB 1001", "bill_number": "1001"}}
+        merge_legislation_info(all_bill_info, [{"bill_id": "HB 1001", "bill_number": "1001"}], prefiled=True)
+        
+        self.assertTrue(all_bill_info["1001"]["prefiled"])
+    
+    def test_entries_without_key_are_skipped(self):
+        """Test entries with neither bill number nor bill ID are ignored"""
+        all_bill_info = {}
+        merge_legislation_info(all_bill_info, [{"bill_id": "", "bill_number": ""}])
+        self.assertEqual(all_bill_info, {})
+    
+    def test_failed_listing_is_reported(self):
+        """Test a listing that errors or fails is reported as None"""
+        def raise_error():
+            raise RuntimeError("boom")
+        
+        self.assertIsNone(fetch_legislation_listing("Broken", raise_error))
+        self.assertIsNone(fetch_legislation_listing("Failed", lambda: None))
+        self.assertEqual(fetch_legislation_listing("Empty", lambda: []), [])
+
+
+class TestUnchangedBills(unittest.TestCase):
+    """Test reuse of bill details from the previous run"""
+    
+    def setUp(self):
+        self.existing = {
+            1001: {"id": "HB1001", "number": "HB 1001", "status": "committee"},
+            5001: {"id": "SB5001", "number": "SB 5001", "status": "introduced"},
+        }
+    
+    def _unchanged(self, existing, last_sync, changed):
+        with mock.patch.object(fetch_all_bills, "get_last_successful_sync", return_value=last_sync), \
+             mock.patch.object(fetch_all_bills, "get_legislative_status_changes", return_value=changed):
+            return get_unchanged_bills(existing)
+    
+    def test_bills_without_status_change_are_reused(self):
+        """Test only bills missing from the status change feed are reused"""
+        unchanged = self._unchanged(self.existing, "2026-02-20T04:00:00", {5001})
+        self.assertEqual(list(unchanged.keys()), [1001])
+        self.assertEqual(unchanged[1001]["id"], "HB1001")
+    
+    def test_full_refresh_without_previous_sync(self):
+        """Test nothing is reused when there is no previous successful sync"""
+        self.assertEqual(self._unchanged(self.existing, None, set()), {})
+        self.assertEqual(self._unchanged({}, "2026-02-20T04:00:00", set()), {})
+    
+    def test_full_refresh_when_feed_unavailable(self):
+        """Test nothing is reused when the status change request fails"""
+        self.assertEqual(self._unchanged(self.existing, "2026-02-20T04:00:00", None), {})
+
+
+class TestWriteDataFiles(unittest.TestCase):
+    """Test batched JSON output"""
+    
+    def test_writes_all_files(self):
+        """Test every payload is written and no staging files are left behind"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_dir = Path(tmp_dir)
+            with mock.patch.object(fetch_all_bills, "DATA_DIR", data_dir):
+                write_data_files({
+                    "bills.json": {"bills": [{"id": "HB1001", "sponsor": "Sen. Nguyễn"}]},
+                    "stats.json": {"totalBills": 1}
+                })
+            
+            self.assertEqual(sorted(p.name for p in data_dir.iterdir()), ["bills.json", "stats.json"])
+            with open(data_dir / "bills.json", encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["bills"][0]["sponsor"], "Sen. Nguyễn")
+            with open(data_dir / "stats.json", encoding="utf-8") as f:
+                self.assertEqual(json.load(f), {"totalBills": 1})
+    
+    def test_streamed_fallback_matches_dump_json(self):
+        """Test files written without orjson are byte-identical to dump_json"""
+        payload = {"bills": [{"id": "HB1001", "sponsor": "Sen. Nguyễn"}], "totalBills": 1}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_dir = Path(tmp_dir)
+            with mock.patch.object(fetch_all_bills, "DATA_DIR", data_dir), \
+                    mock.patch.object(fetch_all_bills, "orjson", None):
+                write_data_files({"bills.json": payload})
+            
+            self.assertEqual((data_dir / "bills.json").read_bytes(), dump_json(payload))
+    
+    def test_stats_and_sync_log_stay_ascii_escaped(self):
+        """Test files other than bills.json keep json.dump's ASCII escaping"""
+        payload = {"bySponsor": {"Sen. Nguyễn": 1}}
+        expected = json.dumps(payload, indent=2).encode("utf-8")
+        for patched_orjson in (fetch_all_bills.orjson, None):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                data_dir = Path(tmp_dir)
+                with mock.patch.object(fetch_all_bills, "DATA_DIR", data_dir), \
+                        mock.patch.object(fetch_all_bills, "orjson", patched_orjson):
+                    write_data_files({"stats.json": payload, "sync-log.json": payload})
+                
+                self.assertEqual((data_dir / "stats.json").read_bytes(), expected)
+                self.assertEqual((data_dir / "sync-log.json").read_bytes(), expected)
+    
+    def test_load_json_round_trip(self):
+        """Test written files load back identically with or without orjson"""
+        payload = {"bills": [{"id": "HB1001", "sponsor": "Sen. Nguyễn"}]}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_dir = Path(tmp_dir)
+            with mock.patch.object(fetch_all_bills, "DATA_DIR", data_dir):
+                write_data_files({"bills.json": payload})
+                self.assertEqual(load_json(data_dir / "bills.json"), payload)
+                with mock.patch.object(fetch_all_bills, "orjson", None):
+                    self.assertEqual(load_json(data_dir / "bills.json"), payload)
+    
+    def test_dump_json_matches_stdlib_format(self):
+        """Test serialized output is identical with or without orjson"""
+        payload = {"bills": [{"id": "HB1001", "hearings": [], "sponsor": "Sen. Nguyễn"}],
+                   "topSponsors": [("Sen. Nguyễn", 3)], "metadata": {}}
+        expected = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+        
+        self.assertEqual(dump_json(payload), expected)
+        with mock.patch.object(fetch_all_bills, "orjson", None):
+            self.assertEqual(dump_json(payload), expected)
+
+
+class TestSOAPRetry(unittest.TestCase):
+    """Test throttled SOAP calls are retried"""
+    
+    def _response(self, status_code):
+        return mock.Mock(status_code=status_code, content=b"<ok/>", text="<ok/>")
+    
+    def test_retries_throttled_response(self):
+        """Test a 503 is retried and the eventual 200 body returned"""
+        responses = [self._response(503), self._response(200)]
+        with mock.patch.object(fetch_all_bills.SESSION, "post", side_effect=responses) as post, \
+                mock.patch.object(fetch_all_bills.time, "sleep"):
+            self.assertEqual(post_soap_request("https://example.test", "Method", {}), b"<ok/>")
+        self.assertEqual(post.call_count, 2)
+    
+    def test_gives_up_after_max_attempts(self):
+        """Test persistent throttling returns None instead of looping forever"""
+        with mock.patch.object(fetch_all_bills.SESSION, "post", return_value=self._response(429)) as post, \
+                mock.patch.object(fetch_all_bills.time, "sleep"):
+            self.assertIsNone(post_soap_request("https://example.test", "Method", {}))
+        self.assertEqual(post.call_count, fetch_all_bills.MAX_ATTEMPTS)
+    
+    def test_server_error_is_not_retried(self):
+        """Test non-throttling HTTP errors fail immediately"""
+        with mock.patch.object(fetch_all_bills.SESSION, "post", return_value=self._response(500)) as post:
+            self.assertIsNone(post_soap_request("https://example.test", "Method", {}))
+        self.assertEqual(post.call_count, 1)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)